@@ -4,12 +4,19 @@ Every ``src/scrapers/<venue>_scraper.py`` extends :class:`BaseScraper`
 and implements :meth:`scrape_events` returning a list of event dicts.
 Subclasses inherit:
 
-- ``self.session`` — a ``requests.Session`` with sensible retry + UA
-  headers for HTML scraping.
+- ``self.session`` — a ``requests.Session`` with browser-like headers and a
+  pooled adapter that retries GETs on 5xx/connection errors
+  (``HTTP_RETRIES`` times, with backoff).
+- ``HTML_PARSER`` (module constant) — the BeautifulSoup tree builder to
+  pass when parsing fetched HTML: ``"lxml"`` when installed, else
+  ``"html.parser"``.
 - ``self.llm_service`` — a :class:`src.llm_service.LLMService` instance
   wired with ``PERPLEXITY_API_KEY`` + ``ANTHROPIC_API_KEY`` from env,
   so subclasses can do smart LLM extraction without threading
   credentials.
+- :meth:`_load_json` — reads a JSON data file for the static-data
+  scrapers (``docs/classical_data.json`` and friends), parsed once per
+  file version and shared between scrapers.
 - :meth:`format_event` — normalizes a raw event dict into the
   pipeline-wide shape (snake_case fields, ISO dates, HH:mm times,
   ``occurrences`` array). Subclasses call this as the final step of
@@ -32,20 +39,45 @@ See ``CLAUDE.md §Adding a New Venue`` and
 ``src/scrapers/afs_scraper.py`` for the canonical pattern.
 """
 
+import json
 import os
 import re
 import requests
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from src.llm_service import LLMService
 from src.enrichment_layer import EnrichmentLayer
 from src.config_loader import ConfigLoader
 
 load_dotenv()
 
+# BeautifulSoup tree builder for HTML scraping. lxml's C parser is several
+# times faster than the pure-Python html.parser, but it is not a pinned
+# dependency, so fall back to the stdlib parser when it isn't installed.
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+@lru_cache(maxsize=8)
+def _parse_json_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse ``path``; memoised on its stat so unchanged files parse once.
+
+    Several static-data scrapers read the same ``docs/classical_data.json``
+    in one run; keying on (mtime, size) makes an edited file reparse.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
 
 class BaseScraper(ABC):
     """
@@ -53,6 +85,9 @@ class BaseScraper(ABC):
     Each venue scraper implements its own adhoc scraping logic.
     """
 
+    # Attempts per request beyond the first for transient 5xx/connection errors.
+    HTTP_RETRIES = 3
+
     def __init__(
         self,
         base_url: str,
@@ -82,6 +117,20 @@ class BaseScraper(ABC):
             }
         )
 
+        # Retry transient 5xx / connection errors on idempotent GETs with
+        # backoff. raise_on_status=False hands the last response back so
+        # callers' status_code checks still see it once retries run out.
+        retry = Retry(
+            total=self.HTTP_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         # Initialize LLM service
         self.llm_service = LLMService()
 
@@ -114,6 +163,21 @@ class BaseScraper(ABC):
         project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         return os.path.join(project_root, *path_components)
 
+    @staticmethod
+    def _load_json(path: str, use_cache: bool = True) -> Any:
+        """Parse a UTF-8 JSON file. Raises ``OSError`` / ``json.JSONDecodeError``
+        so each caller keeps its own missing-file and bad-data handling.
+
+        With ``use_cache`` the parsed object is shared between every caller
+        until the file changes on disk, so callers must copy anything they
+        hand out rather than mutate it.
+        """
+        if not use_cache:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        stat = os.stat(path)
+        return _parse_json_file(path, stat.st_mtime_ns, stat.st_size)
+
     @abstractmethod
     def scrape_events(self) -> List[Dict]:
         """
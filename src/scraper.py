@@ -29,8 +29,7 @@ See ``CLAUDE.md §Adding a New Venue`` for the full checklist and
 
 import json
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List
 
 # Import config loader
@@ -283,9 +282,8 @@ class MultiVenueScraper:
         """Load existing events to cache for duplicate detection"""
         # Original sequential implementation
         if not existing_data_path:
-            existing_data_path = (
-                "/Users/HCornier/Documents/Github/Culture-Calendar/docs/data.json"
-            )
+            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            existing_data_path = os.path.join(project_root, "docs", "data.json")
 
         try:
             if os.path.exists(existing_data_path):
@@ -31,7 +31,6 @@ Two layouts are supported via ``expand_dates``:
 from __future__ import annotations
 
 import json
-import os
 from typing import Any, Dict, List, Optional
 
 from src.base_scraper import BaseScraper
@@ -86,43 +85,36 @@ class StaticJsonScraper(BaseScraper):
 
         return self.default_event_type
 
-    def _build_event(
-        self,
-        event: Dict,
-        *,
-        date: Optional[str] = None,
-        time: Optional[str] = None,
-        dates: Optional[List[str]] = None,
-        times: Optional[List[str]] = None,
-    ) -> Dict:
-        out = {
+    def _event_template(self, event: Dict) -> Dict:
+        """Fields shared by every date of ``event``; built once per event."""
+        return {
             "title": event.get("title"),
             "program": event.get("program"),
             "featured_artist": event.get("featured_artist"),
-            "composers": event.get("composers", []),
-            "works": event.get("works", []),
+            "composers": event.get("composers") or [],
+            "works": event.get("works") or [],
             "series": event.get("series"),
             "venue": self.venue_name,
             "location": event.get("venue_name", self.default_location),
             "type": self._resolve_event_type(event),
             "url": self.base_url,
         }
-        if self.expand_dates:
-            out["date"] = date
-            out["time"] = time
-        else:
-            out["dates"] = list(dates or [])
-            out["times"] = list(times or [])
+
+    @staticmethod
+    def _build_event(template: Dict, **fields: Any) -> Dict:
+        out = template.copy()
+        # Copies: the parsed JSON is shared with other scrapers.
+        out["composers"] = list(template["composers"])
+        out["works"] = list(template["works"])
+        out.update(fields)
         return out
 
     def scrape_events(self, use_cache: bool = True) -> List[Dict]:
-        if not os.path.exists(self.data_file):
+        try:
+            data = self._load_json(self.data_file, use_cache=use_cache)
+        except FileNotFoundError:
             print(f"{self.venue_name} data file not found: {self.data_file}")
             return []
-
-        try:
-            with open(self.data_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
         except (json.JSONDecodeError, OSError) as exc:
             print(f"Error loading {self.venue_name} events from JSON: {exc}")
             return []
@@ -132,25 +124,30 @@ class StaticJsonScraper(BaseScraper):
 
         for event in raw_events:
             dates = event.get("dates", [])
-            times = event.get("times", [])
             if not isinstance(dates, list):
                 dates = [dates] if dates else []
+            if self.expand_dates and not dates:
+                # Undated entries fan out to nothing; skip the remaining work.
+                continue
+            times = event.get("times", [])
             if not isinstance(times, list):
                 times = [times] if times else []
 
+            template = self._event_template(event)
             if self.expand_dates:
-                for i, date in enumerate(dates):
-                    if i < len(times):
-                        time = times[i]
-                    elif times:
-                        time = times[0]
-                    else:
-                        time = self.default_time
-                    standardized.append(self._build_event(event, date=date, time=time))
+                # Dates beyond the listed times reuse the first time.
+                fill = times[0] if times else self.default_time
+                aligned = times + [fill] * (len(dates) - len(times))
+                for date, time in zip(dates, aligned):
+                    standardized.append(
+                        self._build_event(template, date=date, time=time)
+                    )
             else:
                 if not times and dates:
                     times = [self.default_time] * len(dates)
-                standardized.append(self._build_event(event, dates=dates, times=times))
+                standardized.append(
+                    self._build_event(template, dates=list(dates), times=list(times))
+                )
 
         print(f"Loaded {len(standardized)} {self.venue_name} events from JSON")
         return standardized
@@ -3,18 +3,70 @@ Austin Movie Society scraper - scrapes events from website
 """
 
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from html.parser import HTMLParser
 from typing import Dict, List, Optional
-from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-
-from src.base_scraper import BaseScraper
+from bs4 import BeautifulSoup, Tag
+
+from src.base_scraper import HTML_PARSER, BaseScraper
+
+_DIRECTED_BY_RE = re.compile(r"Directed by ([^\n\r<]+)", re.I)
+# "<country>, <year>, <duration>, …" — first three comma fields, stripped.
+_INFO_FIELDS_RE = re.compile(
+    r"\s*([^,]*?)\s*(?:,\s*([^,]*?)\s*(?:,\s*([^,]*?)\s*)?)?(?:,|$)"
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Duration formats, tried in order by _parse_duration_to_minutes.
+_HH_MM_RE = re.compile(r"\s*(\d{1,2})\s*:\s*(\d{1,2})\s*")
+_HOURS_RE = re.compile(r"(\d+)\s*(?:h|hr|hour)\b")
+_MINUTES_RE = re.compile(r"(\d+)\s*(?:m|min)\b")
+_COMPACT_HOUR_MIN_RE = re.compile(r"(\d+)\s*h\s*(\d{1,2})\b")
+_BARE_MINUTES_RE = re.compile(r"\s*(\d{2,3})\s*")
+
+# Language segment parsing used by _parse_languages_from_info.
+_LANG_SEGMENT_RE = re.compile(r"\bIn\s+(.+)$", re.IGNORECASE)
+_SUBTITLES_RE = re.compile(r"\s+with\s+[^.]*?subtitles?", re.IGNORECASE)
+_SEGMENT_END_RE = re.compile(r"[.;\n\r]")
+_LANG_TOKEN_SPLIT_RE = re.compile(r",|/|&|\band\b", re.IGNORECASE)
+_LEADING_IN_RE = re.compile(r"^in\s+", re.IGNORECASE)
+
+
+class _ListingScanner(HTMLParser):
+    """Streaming pass over a listing page that never builds a tree.
+
+    Collects every ``/screening/`` href and notes whether the page carries
+    showtime markup (a dropdown trigger or a ``div.c-showtime-display``),
+    i.e. whether it is itself a movie page.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.hrefs: List[str] = []
+        self.is_movie_page = False
+
+    def handle_starttag(self, tag, attrs):
+        attr_map = dict(attrs)
+        classes = (attr_map.get("class") or "").split()
+        if "c-showtime-select__trigger" in classes or (
+            tag == "div" and "c-showtime-display" in classes
+        ):
+            self.is_movie_page = True
+        if tag == "a":
+            href = attr_map.get("href")
+            if href and "/screening/" in href:
+                self.hrefs.append(href)
 
 
 class AFSScraper(BaseScraper):
     """Austin Movie Society scraper - extracts movie screenings from website."""
 
+    # Concurrent /screening/ page fetches; small enough to stay polite to
+    # austinfilm.org and within the session's connection pool.
+    MAX_FETCH_WORKERS = 4
+
     def __init__(self, config=None, venue_key="afs"):
         super().__init__(
             base_url="https://www.austinfilm.org",
@@ -52,40 +104,40 @@ class AFSScraper(BaseScraper):
         try:
             all_events: List[Dict] = []
             print(f"Scraping {self.venue_name}...")
-            urls_to_try = [
-                f"{self.base_url}/screenings/",
-                f"{self.base_url}/calendar/",
-                f"{self.base_url}/",
-            ]
+            # Listing pages come from get_target_urls() so venue changes land
+            # in one place; the homepage is only reached when they yield nothing.
+            urls_to_try = list(
+                dict.fromkeys(self.get_target_urls() + [f"{self.base_url}/"])
+            )
             for url in urls_to_try:
                 try:
                     response = self.session.get(url, timeout=15, allow_redirects=True)
                     if response.status_code != 200:
                         continue
-                    soup = BeautifulSoup(response.text, "html.parser")
+                    # Listing pages are only scanned for links; a DOM is built
+                    # only when the URL turns out to be a movie page.
+                    scan = _ListingScanner()
+                    scan.feed(response.text)
+                    scan.close()
 
                     # Case 1: URL is itself a movie page.
-                    if self._is_movie_page(soup):
+                    if scan.is_movie_page:
+                        soup = BeautifulSoup(response.text, HTML_PARSER)
                         events = self._extract_movie_page_events(soup, url)
                         if events:
                             all_events.extend(events)
                             break
 
                     # Case 2: URL is a listing; follow each /screening/ link.
-                    for movie_url in self._discover_screening_urls(soup):
-                        try:
-                            movie_response = self.session.get(movie_url, timeout=10)
-                            if movie_response.status_code != 200:
-                                continue
-                            movie_soup = BeautifulSoup(
-                                movie_response.text, "html.parser"
-                            )
-                            all_events.extend(
-                                self._extract_movie_page_events(movie_soup, movie_url)
-                            )
-                        except Exception as e:
-                            print(f"  AFS: failed on {movie_url}: {e!r}")
-                            continue
+                    # Pages are fetched concurrently; map() keeps listing order.
+                    movie_urls = self._discover_screening_urls(scan.hrefs)
+                    with ThreadPoolExecutor(
+                        max_workers=self.MAX_FETCH_WORKERS
+                    ) as executor:
+                        for events in executor.map(
+                            self._fetch_movie_page_events, movie_urls
+                        ):
+                            all_events.extend(events)
                     if all_events:
                         break
                 except Exception as e:
@@ -97,27 +149,28 @@ class AFSScraper(BaseScraper):
             print(f"AFS scrape_events fatal error: {e!r}")
             return []
 
-    def _is_movie_page(self, soup: BeautifulSoup) -> bool:
-        """A movie page has either showtime trigger buttons or a showtime display div."""
-        return bool(
-            soup.select(".c-showtime-select__trigger")
-            or soup.select("div.c-showtime-display")
-        )
+    def _fetch_movie_page_events(self, movie_url: str) -> List[Dict]:
+        """Fetch one /screening/ page and extract its events ([] on failure)."""
+        try:
+            movie_response = self.session.get(movie_url, timeout=10)
+            if movie_response.status_code != 200:
+                return []
+            movie_soup = BeautifulSoup(movie_response.text, HTML_PARSER)
+            return self._extract_movie_page_events(movie_soup, movie_url)
+        except Exception as e:
+            print(f"  AFS: failed on {movie_url}: {e!r}")
+            return []
 
-    def _discover_screening_urls(self, soup: BeautifulSoup) -> List[str]:
-        """Find every /screening/<slug>/ link on a listing/calendar page, absolutised."""
-        urls: List[str] = []
-        for link in soup.find_all("a", href=True):
-            href = link.get("href", "")
-            if "/screening/" not in href:
-                continue
+    def _discover_screening_urls(self, hrefs: List[str]) -> List[str]:
+        """Absolutise and de-duplicate /screening/<slug>/ links, keeping order."""
+        urls: Dict[str, None] = {}
+        for href in hrefs:
             if href.startswith("/"):
                 href = f"{self.base_url}{href}"
             elif not href.startswith("http"):
                 href = f"{self.base_url}/{href}"
-            if href not in urls:
-                urls.append(href)
-        return urls
+            urls.setdefault(href)
+        return list(urls)
 
     def _extract_movie_page_events(
         self, soup: BeautifulSoup, source_url: str
@@ -128,27 +181,19 @@ class AFSScraper(BaseScraper):
         if not title:
             return []
 
-        director = None
-        director_elem = soup.find(string=re.compile(r"Directed by ", re.I))
-        if director_elem:
-            match = re.search(r"Directed by ([^\n\r<]+)", director_elem)
-            if match:
-                director = match.group(1).strip()
+        # Director and the "<country>, <year>, <duration>" line both live in
+        # the screening header block; look it up once and search inside it.
+        header = soup.select_one(".c-screening-data")
+        director = self._extract_director(header, soup)
 
-        info_elem = soup.find("p", class_="t-smaller")
+        info_elem = (header and header.find("p", class_="t-smaller")) or soup.find(
+            "p", class_="t-smaller"
+        )
         year = country = language = duration = None
         if info_elem:
             info_text = info_elem.get_text()
-            parts = [p.strip() for p in info_text.split(",")]
-            if parts:
-                country = parts[0]
-            if len(parts) > 1:
-                try:
-                    year = int(parts[1])
-                except ValueError:
-                    year = None
-            if len(parts) > 2:
-                duration = parts[2]
+            country, year_str, duration = _INFO_FIELDS_RE.match(info_text).groups()
+            year = int(year_str) if year_str and year_str.isdecimal() else None
             language = self._parse_languages_from_info(info_text, country)
 
         desc_elem = soup.find("div", class_="c-screening-content")
@@ -156,11 +201,18 @@ class AFSScraper(BaseScraper):
             desc_elem.get_text(separator=" ", strip=True) if desc_elem else None
         )
 
-        date_map = self._extract_date_map(soup)
+        # One selector pass over the showtime panels, indexed by id, replaces
+        # a whole-tree soup.find(id=...) per date.
+        displays: Dict[str, Tag] = {}
+        for div in soup.select("div.c-showtime-display"):
+            displays.setdefault(div.get("id", ""), div)
+        date_map = self._extract_date_map(soup, displays)
+        runtime_minutes = self._parse_duration_to_minutes(duration)
 
         events: List[Dict] = []
         for data_target, date_fmt in date_map.items():
-            showtime_div = soup.find("div", id=f"showtime-{data_target}")
+            div_id = f"showtime-{data_target}"
+            showtime_div = displays.get(div_id) or soup.find("div", id=div_id)
             if not showtime_div:
                 continue
             for btn in showtime_div.find_all("a", class_="c-button"):
@@ -175,7 +227,7 @@ class AFSScraper(BaseScraper):
                         "release_year": year,
                         "country": country,
                         "language": language,
-                        "runtime_minutes": self._parse_duration_to_minutes(duration),
+                        "runtime_minutes": runtime_minutes,
                         "dates": [date_fmt],
                         "times": [time_str],
                         "venue": "AFS Cinema",
@@ -186,11 +238,28 @@ class AFSScraper(BaseScraper):
         return events
 
     @staticmethod
-    def _extract_date_map(soup: BeautifulSoup) -> Dict[str, str]:
+    def _extract_director(header, soup: BeautifulSoup) -> Optional[str]:
+        """Find the 'Directed by …' credit without walking every text node.
+
+        ``header`` is the page's .c-screening-data block, where the credit
+        sits; the main/article container is searched only when it has none.
+        """
+        match = header is not None and _DIRECTED_BY_RE.search(header.get_text("\n"))
+        if not match:
+            main = soup.select_one("main, article")
+            match = main is not None and _DIRECTED_BY_RE.search(main.get_text("\n"))
+        return match.group(1).strip() if match else None
+
+    @staticmethod
+    def _extract_date_map(
+        soup: BeautifulSoup, displays: Optional[Dict[str, Tag]] = None
+    ) -> Dict[str, str]:
         """Map 'YYYYMMDD' → 'YYYY-MM-DD' for every showtime date on the page.
 
         AFS exposes showtimes two ways: the dropdown trigger (data-target attr)
         and the showtime-<date> div IDs. Either is enough on its own.
+        ``displays`` is the caller's id → div.c-showtime-display index, reused
+        here instead of re-selecting the panels.
         """
         date_map: Dict[str, str] = {}
         for li in soup.select(".c-showtime-select__trigger"):
@@ -200,8 +269,12 @@ class AFSScraper(BaseScraper):
                     f"{data_target[:4]}-{data_target[4:6]}-{data_target[6:]}"
                 )
         if not date_map:
-            for div in soup.select("div.c-showtime-display"):
-                div_id = div.get("id", "")
+            if displays is None:
+                displays = {
+                    div.get("id", ""): div
+                    for div in soup.select("div.c-showtime-display")
+                }
+            for div_id in displays:
                 if div_id.startswith("showtime-") and len(div_id) == 17:
                     data_target = div_id.removeprefix("showtime-")
                     if len(data_target) == 8:
@@ -210,7 +283,9 @@ class AFSScraper(BaseScraper):
                         )
         return date_map
 
-    def _parse_duration_to_minutes(self, duration_str):
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_duration_to_minutes(duration_str):
         """Parse duration string into total minutes.
 
         Supports common formats found on AFS pages, including:
@@ -220,6 +295,7 @@ class AFSScraper(BaseScraper):
         - "1:50" (hh:mm)
         - "2h" (hours only) or "45m" (minutes only)
         Returns an integer number of minutes, or None when unparseable.
+        Memoized: every showtime on a movie page shares the same duration.
         """
         if duration_str is None:
             return None
@@ -237,7 +313,7 @@ class AFSScraper(BaseScraper):
         s = s.replace("hrs", "hr")
 
         # 1) hh:mm format
-        m = re.fullmatch(r"\s*(\d{1,2})\s*:\s*(\d{1,2})\s*", s)
+        m = _HH_MM_RE.fullmatch(s)
         if m:
             hours = int(m.group(1))
             minutes = int(m.group(2))
@@ -247,11 +323,11 @@ class AFSScraper(BaseScraper):
         hours = 0
         minutes = 0
 
-        mh = re.search(r"(\d+)\s*(?:h|hr|hour)\b", s)
+        mh = _HOURS_RE.search(s)
         if mh:
             hours = int(mh.group(1))
 
-        mm = re.search(r"(\d+)\s*(?:m|min)\b", s)
+        mm = _MINUTES_RE.search(s)
         if mm:
             minutes = int(mm.group(1))
 
@@ -259,19 +335,21 @@ class AFSScraper(BaseScraper):
             return hours * 60 + minutes
 
         # 3) Compact hour-minute without trailing unit on minutes (e.g., "1h 50")
-        m = re.search(r"(\d+)\s*h\s*(\d{1,2})\b", s)
+        m = _COMPACT_HOUR_MIN_RE.search(s)
         if m:
             return int(m.group(1)) * 60 + int(m.group(2))
 
         # 4) Bare number interpreted as minutes (e.g., "90")
-        m = re.fullmatch(r"\s*(\d{2,3})\s*", s)
+        m = _BARE_MINUTES_RE.fullmatch(s)
         if m:
             return int(m.group(1))
 
         return None
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
     def _parse_languages_from_info(
-        self, info_text: str, country: Optional[str]
+        info_text: str, country: Optional[str]
     ) -> Optional[str]:
         """Extract language(s) from the info text.
 
@@ -304,26 +382,24 @@ class AFSScraper(BaseScraper):
 
         s = info_text.replace("\u00a0", " ")
         # Look for a segment beginning with "In "
-        m = re.search(r"\bIn\s+(.+)$", s, re.IGNORECASE)
+        m = _LANG_SEGMENT_RE.search(s)
         lang_segment = None
         if m:
             lang_segment = m.group(1)
             # Cut off subtitles or trailing punctuation after languages
-            lang_segment = re.split(
-                r"\s+with\s+[^.]*?subtitles?", lang_segment, flags=re.IGNORECASE
-            )[0]
-            lang_segment = re.split(r"[.;\n\r]", lang_segment)[0]
+            lang_segment = _SUBTITLES_RE.split(lang_segment)[0]
+            lang_segment = _SEGMENT_END_RE.split(lang_segment)[0]
 
         if lang_segment:
             # Tokenize on commas, slashes, ampersands and the word 'and'
-            tokens = re.split(r",|/|&|\band\b", lang_segment, flags=re.IGNORECASE)
+            tokens = _LANG_TOKEN_SPLIT_RE.split(lang_segment)
             cleaned: list[str] = []
             for token in tokens:
                 t = token.strip()
                 if not t:
                     continue
                 # Remove leading 'In '
-                t = re.sub(r"^in\s+", "", t, flags=re.IGNORECASE)
+                t = _LEADING_IN_RE.sub("", t)
                 # Remove residual punctuation
                 t = t.strip(" .")
                 if not t:
@@ -337,7 +413,7 @@ class AFSScraper(BaseScraper):
                 result: list[str] = []
                 seen: set[str] = set()
                 for t in cleaned:
-                    name = re.sub(r"\s+", " ", t).strip().title()
+                    name = _WHITESPACE_RE.sub(" ", t).strip().title()
                     key = name.lower()
                     if key not in seen:
                         seen.add(key)
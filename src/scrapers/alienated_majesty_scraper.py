@@ -7,22 +7,125 @@ pyppeteer in 2026-04 because pyppeteer's bundled Chromium crashes on
 Python 3.13.
 """
 
+import logging
 import os
 import re
 import sys
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import date, datetime
+from hashlib import sha1
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-from src.base_scraper import BaseScraper
+from src.base_scraper import HTML_PARSER, BaseScraper
 
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 
+logger = logging.getLogger(__name__)
+
+_MAIN_ONLY = SoupStrainer("main")
+
+# Break between book-club sections in the LLM prompt. A short rule marks the
+# boundary just as well as a 50-character one and costs fewer input tokens.
+_SECTION_SEPARATOR = "\n\n---\n\n"
+
+_WEEKDAYS = "Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday"
+
+# '<Weekday>, <Mon> <D> - <Book> by <Author>' entries under an UPCOMING header.
+_UPCOMING_ENTRY_RE = re.compile(
+    rf"({_WEEKDAYS}),\s*([A-Za-z]+\.?)\s+(\d{{1,2}})"
+    rf"\s*[-–—]\s*(.+?)(?=(?:{_WEEKDAYS}),|\Z)",
+    re.IGNORECASE | re.DOTALL,
+)
+_VIEW_MORE_RE = re.compile(r"\bView\s+all\b|\bView\s+more\b")
+_BY_RE = re.compile(r"\s+by\s+")
+
+# Legacy series-text parsing (_parse_series_text / _parse_meeting_text).
+_SERIES_MEETING_RE = re.compile(
+    rf"({_WEEKDAYS}),\s*(\w+)\s*(\d+)\s*—\s*(.+?)\s*by\s+(.+?)(?=(?:{_WEEKDAYS})|$)",
+    re.IGNORECASE | re.DOTALL,
+)
+_PAREN_RE = re.compile(r"\s*\(")
+_WEEKDAY_RE = re.compile(rf"({_WEEKDAYS})", re.IGNORECASE)
+_MEETING_DATE_RE = re.compile(r"(\w+),\s*(\w+)\s*(\d+)")
+_MEETING_BOOK_RE = re.compile(r"—\s*(.+?)\s*by\s+(.+?)(?:\s*\(|$)")
+
+# Lower-cased month name -> number. _convert_to_date_format accepts only full
+# names; _month_number also takes three-letter abbreviations and "sept".
+_FULL_MONTH_NUMBERS = {
+    name: num
+    for num, name in enumerate(
+        (
+            "january",
+            "february",
+            "march",
+            "april",
+            "may",
+            "june",
+            "july",
+            "august",
+            "september",
+            "october",
+            "november",
+            "december",
+        ),
+        start=1,
+    )
+}
+_MONTH_NUMBERS = {
+    **_FULL_MONTH_NUMBERS,
+    **{name[:3]: num for name, num in _FULL_MONTH_NUMBERS.items()},
+    "sept": 9,
+}
+
+# Series name -> (time, host, description) for the legacy series-text parser.
+_SERIES_INFO: Dict[str, Tuple[str, Optional[str], str]] = {
+    "NYRB Book Club": (
+        "11:00 AM",
+        "Austin NYRB Book Club",
+        "Only the (NYRB) Classics. Meets the 1st Saturday of every month at 11am. Run by the Austin NYRB Book Club.",
+    ),
+    "Subculture Lit": (
+        "3:00 PM",
+        "East Austin Writing Project",
+        "Small presses, experimental and transgressive writers and work. Meets the 2nd Sunday of every month at 3pm. Run by East Austin Writing Project.",
+    ),
+    "A Season Of": (
+        "11:00 AM",
+        "Austin NYRB Book Club",
+        "Reading a single author or title for a season. Meets the 3rd Saturday of every month at 11am. Run by the Austin NYRB Book Club.",
+    ),
+    "Voyage Out": (
+        "5:00 PM",
+        None,
+        "A regional reading series. Meets the 3rd Sunday of every month at 5pm.",
+    ),
+    "Apricot Trees Exist": (
+        "3:00 PM",
+        None,
+        "Reading poems for generative inspiration. Meets the 4th Sunday of every month at 3pm.",
+    ),
+}
+_DEFAULT_SERIES_DETAILS = ("7:00 PM", None, "Book club meeting")
+
+# Series headers _extract_with_beautifulsoup will parse: every series with
+# known details plus the newer ones that fall back to the defaults.
+_RECOGNIZED_SERIES = frozenset(_SERIES_INFO) | {
+    "Art Sex Magic",
+    "Paper Cuts @ AFS Cinema",
+}
+
+# Playwright resource types aborted while rendering. Stylesheets and scripts
+# still load so the page's JS renders the book-club sections as usual.
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
 
 class AlienatedMajestyBooksScraper(BaseScraper):
     """Scraper for Alienated Majesty Books events using pyppeteer for JS rendering"""
 
+    RENDER_CACHE_DIR = "cache/alienated_majesty"
+
     def __init__(self, config=None, venue_key="alienated_majesty"):
         super().__init__(
             base_url="https://www.alienatedmajestybooks.com",
@@ -60,6 +163,16 @@ class AlienatedMajestyBooksScraper(BaseScraper):
                             "Chrome/120.0.0.0 Safari/537.36"
                         )
                     )
+                    # Only the DOM text matters; skip binary assets so the
+                    # page reaches networkidle without downloading them.
+                    page.route(
+                        "**/*",
+                        lambda route: (
+                            route.abort()
+                            if route.request.resource_type in _BLOCKED_RESOURCE_TYPES
+                            else route.continue_()
+                        ),
+                    )
                     page.goto(url, wait_until="networkidle", timeout=30000)
                     html_content = page.content()
                     print(f"  Got {len(html_content)} chars from Playwright")
@@ -70,12 +183,44 @@ class AlienatedMajestyBooksScraper(BaseScraper):
             print(f"  Playwright error: {e}")
             return ""
 
-    def _scrape_with_pyppeteer(self, url: str) -> List[Dict]:
+    def _render_cache_path(self, url: str, day: str) -> Path:
+        """``cache/alienated_majesty/<YYYY-MM-DD>-<sha1(url)>.html``."""
+        url_key = sha1(url.encode()).hexdigest()
+        return Path(self.RENDER_CACHE_DIR) / f"{day}-{url_key}.html"
+
+    def _render_cached(self, url: str, use_cache: bool = True) -> Tuple[str, bool]:
+        """Return ``(html, from_cache)`` for ``url``.
+
+        Reuses today's stored render unless ``use_cache`` is False, so reruns
+        on the same day skip the browser. Nothing is written here: a fresh
+        render is only stored by :meth:`_store_render` once it has yielded
+        events, so a partial render is never replayed.
+        """
+        cache_path = self._render_cache_path(url, date.today().isoformat())
+        if use_cache and cache_path.exists():
+            print(f"  Using cached render for {url}")
+            return cache_path.read_text(encoding="utf-8"), True
+        return self._render_with_playwright(url), False
+
+    def _store_render(self, url: str, html_content: str) -> None:
+        """Cache a render that produced events; drop renders from earlier days."""
+        today = date.today().isoformat()
+        cache_dir = Path(self.RENDER_CACHE_DIR)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for stale in cache_dir.glob("*.html"):
+            if not stale.name.startswith(f"{today}-"):
+                stale.unlink(missing_ok=True)
+        self._render_cache_path(url, today).write_text(html_content, encoding="utf-8")
+
+    def _scrape_with_pyppeteer(self, url: str, use_cache: bool = True) -> List[Dict]:
         """Backwards-compatible name; routes to Playwright now."""
-        html_content = self._render_with_playwright(url)
+        html_content, from_cache = self._render_cached(url, use_cache)
         if not html_content:
             return []
-        return self._extract_book_club_events(html_content, url)
+        events = self._extract_book_club_events(html_content, url)
+        if events and not from_cache:
+            self._store_render(url, html_content)
+        return events
 
     def _extract_book_club_events(self, html_content: str, url: str) -> List[Dict]:
         """Extract book club events from rendered HTML.
@@ -83,10 +228,17 @@ class AlienatedMajestyBooksScraper(BaseScraper):
         Strategy: parse 'UPCOMING CLUBS' / 'UPCOMING SCREENINGS' sections
         directly from BeautifulSoup. The page lists each upcoming meeting as
         '<Weekday>, <Month> <Day> - <Book> by <Author>' under the series
-        header. LLM extraction is a fallback.
+        header. If that finds nothing, try the older per-series layout
+        ('<Weekday>, <Month> <Day> — <Book> by <Author>' inside each series
+        block) before paying for LLM extraction as the last resort.
         """
         events: List[Dict] = []
-        soup = BeautifulSoup(html_content, "html.parser")
+        # Only <main> holds the series/UPCOMING headers; skip building nav,
+        # footer and script nodes. Fall back to a full parse if the layout
+        # ever drops <main>.
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=_MAIN_ONLY)
+        if not soup.find("h2"):
+            soup = BeautifulSoup(html_content, HTML_PARSER)
         try:
             events = self._extract_upcoming_meetings(soup, url)
             if events:
@@ -95,9 +247,14 @@ class AlienatedMajestyBooksScraper(BaseScraper):
         except Exception as e:
             print(f"  Direct HTML extraction error: {e}")
 
+        events = self._extract_with_beautifulsoup(soup, url)
+        if events:
+            print(f"  ✓ Parsed {len(events)} meetings from series sections")
+            return events
+
         try:
             print("  Falling back to LLM extraction…")
-            events = self._extract_with_llm(html_content, url)
+            events = self._extract_with_llm(html_content, url, soup)
             if events:
                 print(f"  ✓ LLM extracted {len(events)} events")
                 return events
@@ -122,13 +279,6 @@ class AlienatedMajestyBooksScraper(BaseScraper):
         all_h2 = soup.find_all("h2")
         current_series: Optional[str] = None
 
-        entry_re = re.compile(
-            r"(Sunday|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday)"
-            r",\s*([A-Za-z]+\.?)\s+(\d{1,2})"
-            r"\s*[-–—]\s*(.+?)(?=(?:Sunday|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday),|\Z)",
-            re.IGNORECASE | re.DOTALL,
-        )
-
         for idx, header in enumerate(all_h2):
             classes = set(header.get("class") or [])
             text = header.get_text().strip()
@@ -162,9 +312,9 @@ class AlienatedMajestyBooksScraper(BaseScraper):
             tail = " ".join(collected)
             # Trim everything after a 'View all' / 'View more' marker that the
             # site appends to each section.
-            tail = re.split(r"\bView\s+all\b|\bView\s+more\b", tail, maxsplit=1)[0]
+            tail = _VIEW_MORE_RE.split(tail, maxsplit=1)[0]
 
-            for m in entry_re.finditer(tail):
+            for m in _UPCOMING_ENTRY_RE.finditer(tail):
                 month_token = m.group(2).rstrip(".")
                 day = int(m.group(3))
                 title_part = m.group(4).strip().rstrip(".").rstrip()
@@ -256,44 +406,27 @@ class AlienatedMajestyBooksScraper(BaseScraper):
 
     @staticmethod
     def _month_number(token: str) -> Optional[int]:
-        months = {
-            "jan": 1,
-            "january": 1,
-            "feb": 2,
-            "february": 2,
-            "mar": 3,
-            "march": 3,
-            "apr": 4,
-            "april": 4,
-            "may": 5,
-            "jun": 6,
-            "june": 6,
-            "jul": 7,
-            "july": 7,
-            "aug": 8,
-            "august": 8,
-            "sep": 9,
-            "sept": 9,
-            "september": 9,
-            "oct": 10,
-            "october": 10,
-            "nov": 11,
-            "november": 11,
-            "dec": 12,
-            "december": 12,
-        }
-        return months.get(token.lower())
+        return _MONTH_NUMBERS.get(token.lower())
 
     @staticmethod
     def _split_title_by_author(text: str) -> tuple[Optional[str], Optional[str]]:
         """Split 'Book Title by Author Name' on the LAST ' by ' occurrence."""
-        parts = re.split(r"\s+by\s+", text)
+        parts = _BY_RE.split(text)
         if len(parts) >= 2:
             book = " by ".join(parts[:-1]).strip()
             author = parts[-1].strip()
             return (book or None), (author or None)
         return text.strip() or None, None
 
+    @staticmethod
+    def _section_container(header):
+        """Nearest ancestor of a series header that contains a <p>.
+
+        find("p") stops at the first paragraph, so each ancestor test is
+        short-circuited instead of collecting every <p> below it.
+        """
+        return header.find_parent(lambda tag: tag.find("p") is not None)
+
     def _extract_with_beautifulsoup(self, soup: BeautifulSoup, url: str) -> List[Dict]:
         """Extract events using BeautifulSoup pattern matching"""
         events = []
@@ -303,24 +436,13 @@ class AlienatedMajestyBooksScraper(BaseScraper):
                 "h2", class_=lambda c: c in {"bm-txt-1", "bm-txt-2"}
             )
 
-            recognised = {
-                "NYRB Book Club",
-                "Subculture Lit",
-                "A Season Of",
-                "Voyage Out",
-                "Apricot Trees Exist",
-                "Art Sex Magic",
-                "Paper Cuts @ AFS Cinema",
-            }
             for header in book_club_headers:
                 series_name = header.get_text().strip()
-                if series_name not in recognised:
+                if series_name not in _RECOGNIZED_SERIES:
                     continue
 
                 # Find the parent container with the book club content
-                container = header.find_parent()
-                while container and not container.find_all("p"):
-                    container = container.find_parent()
+                container = self._section_container(header)
 
                 if not container:
                     continue
@@ -338,12 +460,19 @@ class AlienatedMajestyBooksScraper(BaseScraper):
             print(f"  BeautifulSoup extraction error: {e}")
             return []
 
-    def _extract_with_llm(self, html_content: str, url: str) -> List[Dict]:
-        """Extract events using LLM with enhanced prompting"""
+    def _extract_with_llm(
+        self, html_content: str, url: str, soup: Optional[BeautifulSoup] = None
+    ) -> List[Dict]:
+        """Extract events using LLM with enhanced prompting.
+
+        Pass ``soup`` when the caller has already parsed ``html_content`` to
+        skip a second parse.
+        """
         try:
             # First, let's simplify the HTML content for better LLM processing
             # Extract just the main content section
-            soup = BeautifulSoup(html_content, "html.parser")
+            if soup is None:
+                soup = BeautifulSoup(html_content, HTML_PARSER)
 
             # Find the main content area
             main_content = soup.find("main")
@@ -358,8 +487,9 @@ class AlienatedMajestyBooksScraper(BaseScraper):
             if len(simplified_content) > 6000:
                 simplified_content = simplified_content[:6000] + "..."
 
-            print(
-                f"  Using simplified content with separators ({len(simplified_content)} chars)"
+            logger.debug(
+                "Using simplified content with separators (%d chars)",
+                len(simplified_content),
             )
 
             from datetime import datetime
@@ -419,7 +549,9 @@ class AlienatedMajestyBooksScraper(BaseScraper):
                 content=simplified_content, schema=schema, url=url, content_type="text"
             )
 
-            print(f"  LLM service returned: success={extraction_result.get('success')}")
+            logger.debug(
+                "LLM service returned: success=%s", extraction_result.get("success")
+            )
             if not extraction_result.get("success"):
                 print(f"  Error: {extraction_result.get( 'error','Unknown error')}")
 
@@ -427,15 +559,22 @@ class AlienatedMajestyBooksScraper(BaseScraper):
                 data = extraction_result.get("data", {})
                 events = data.get("events", [])
 
-                print(f"  Raw events from LLM: {len(events)}")
+                logger.debug("Raw events from LLM: %d", len(events))
 
                 # Debug: show what fields the LLM is actually returning
                 if events:
-                    print(f"  Sample event fields: {list(events[0].keys())}")
-                    print(f"  Raw LLM event: {events[0]}")
+                    logger.debug("Sample event fields: %s", list(events[0].keys()))
+                    logger.debug("Raw LLM event: %s", events[0])
 
                 # Post-process events to ensure proper formatting
                 processed_events = []
+                # Event type comes from the venue's assumed category in config;
+                # it is the same for every event, so look it up once.
+                event_type = (
+                    self.config.get_assumed_event_category(self.venue_key)
+                    if self.config
+                    else None
+                )
 
                 for event in events:
                     # Apply default values from configuration
@@ -447,19 +586,14 @@ class AlienatedMajestyBooksScraper(BaseScraper):
                         mapped_event = event
 
                     # Debug: show corrected event after mapping
-                    if len(processed_events) == 0:  # Only show first event
-                        print(f"  Corrected event: {mapped_event}")
+                    if not processed_events:  # Only show first event
+                        logger.debug("Corrected event: %s", mapped_event)
 
                     # Ensure URL is set (this is runtime data, not config)
                     if not mapped_event.get("url"):
                         mapped_event["url"] = url
 
-                    # Set event type based on venue's assumed category from config
-                    mapped_event["type"] = (
-                        self.config.get_assumed_event_category(self.venue_key)
-                        if self.config
-                        else None
-                    )
+                    mapped_event["type"] = event_type
                     processed_events.append(mapped_event)
 
                 return processed_events
@@ -489,15 +623,12 @@ class AlienatedMajestyBooksScraper(BaseScraper):
 
             sections = []
             for header in book_club_headers:
-                container = header.find_parent()
-                while container and not container.find_all("p"):
-                    container = container.find_parent()
+                container = self._section_container(header)
                 if container:
                     sections.append(container.get_text(separator=" ", strip=True))
 
             if sections:
-                separator = "\n\n" + "=" * 50 + "\n\n"
-                return separator.join(sections)
+                return _SECTION_SEPARATOR.join(sections)
             return main_content.get_text(separator=" ", strip=True)
 
         except Exception as e:
@@ -510,37 +641,43 @@ class AlienatedMajestyBooksScraper(BaseScraper):
     ) -> List[Dict]:
         """Parse series text content to extract all meeting events"""
         events = []
+        today = datetime.now()
 
         try:
             # Find all meeting lines with day of week, month, and date
-            meeting_pattern = r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday),\s*(\w+)\s*(\d+)\s*—\s*(.+?)\s*by\s+(.+?)(?=(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)|$)"
-            meetings = re.findall(
-                meeting_pattern, text_content, re.IGNORECASE | re.DOTALL
-            )
+            meetings = _SERIES_MEETING_RE.findall(text_content)
 
             for day_name, month_name, day_num, book_title, author in meetings:
                 # Clean up book title and author
-                book_title = re.sub(
-                    r"<[^>]+>", "", book_title
-                ).strip()  # Remove HTML tags
+                # Input is get_text() output, so there are no tags to strip.
                 book_title = book_title.strip().strip('"').strip("'").strip()
-
-                author = re.sub(r"<[^>]+>", "", author).strip()  # Remove HTML tags
                 author = author.strip()
 
                 # Remove any trailing text after author (like publisher info)
-                author = re.split(r"\s*\(", author)[0].strip()
+                author = _PAREN_RE.split(author)[0].strip()
 
                 # Convert to proper date format
-                date_str = self._convert_to_date_format(month_name, day_num)
+                date_str = self._convert_to_date_format(month_name, day_num, today)
                 if not date_str:
                     continue
 
+                event_title = f"{series_name} - {book_title}"
+                # Paper Cuts is a pop-up bookshop, not a book club; emit it
+                # the same way _extract_upcoming_meetings does.
+                if series_name.startswith("Paper Cuts"):
+                    events.append(
+                        self._build_paper_cuts_event(
+                            event_title, book_title, date_str, url
+                        )
+                    )
+                    continue
+
                 # Determine time and other details based on series
                 time_str, host, description = self._get_series_details(series_name)
 
                 event = {
-                    "title": f"{series_name} - {book_title}",
+                    "title": event_title,
+                    "type": "book_club",
                     "book": book_title,
                     "author": author,
                     "dates": [date_str],  # Use dates array
@@ -566,22 +703,18 @@ class AlienatedMajestyBooksScraper(BaseScraper):
             text = str(meeting_text).strip()
 
             # Skip if not a meeting line
-            if not re.search(
-                r"(Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)",
-                text,
-                re.IGNORECASE,
-            ):
+            if not _WEEKDAY_RE.search(text):
                 return None
 
             # Extract date pattern
-            date_match = re.search(r"(\w+),\s*(\w+)\s*(\d+)", text)
+            date_match = _MEETING_DATE_RE.search(text)
             if not date_match:
                 return None
 
             day_name, month_name, day_num = date_match.groups()
 
             # Extract book and author
-            book_match = re.search(r"—\s*(.+?)\s*by\s+(.+?)(?:\s*\(|$)", text)
+            book_match = _MEETING_BOOK_RE.search(text)
             if not book_match:
                 return None
 
@@ -615,34 +748,22 @@ class AlienatedMajestyBooksScraper(BaseScraper):
             print(f"  Error parsing meeting text '{meeting_text}': {e}")
             return None
 
-    def _convert_to_date_format(self, month_name: str, day_num: str) -> Optional[str]:
-        """Convert month name and day to YYYY-MM-DD format with smart year detection"""
-        try:
-            from datetime import datetime
-
-            month_map = {
-                "january": 1,
-                "february": 2,
-                "march": 3,
-                "april": 4,
-                "may": 5,
-                "june": 6,
-                "july": 7,
-                "august": 8,
-                "september": 9,
-                "october": 10,
-                "november": 11,
-                "december": 12,
-            }
+    def _convert_to_date_format(
+        self, month_name: str, day_num: str, today: Optional[datetime] = None
+    ) -> Optional[str]:
+        """Convert month name and day to YYYY-MM-DD format with smart year detection.
 
-            month_num = month_map.get(month_name.lower())
+        ``today`` lets callers parsing many meetings read the clock once.
+        """
+        try:
+            month_num = _FULL_MONTH_NUMBERS.get(month_name.lower())
             if not month_num:
                 return None
 
             day = int(day_num)
 
             # Get current date
-            now = datetime.now()
+            now = today or datetime.now()
             current_year = now.year
             current_month = now.month
 
@@ -661,45 +782,21 @@ class AlienatedMajestyBooksScraper(BaseScraper):
 
     def _get_series_details(self, series_name: str) -> tuple:
         """Get time, host, and description for each series with full descriptions"""
-        series_info = {
-            "NYRB Book Club": (
-                "11:00 AM",
-                "Austin NYRB Book Club",
-                "Only the (NYRB) Classics. Meets the 1st Saturday of every month at 11am. Run by the Austin NYRB Book Club.",
-            ),
-            "Subculture Lit": (
-                "3:00 PM",
-                "East Austin Writing Project",
-                "Small presses, experimental and transgressive writers and work. Meets the 2nd Sunday of every month at 3pm. Run by East Austin Writing Project.",
-            ),
-            "A Season Of": (
-                "11:00 AM",
-                "Austin NYRB Book Club",
-                "Reading a single author or title for a season. Meets the 3rd Saturday of every month at 11am. Run by the Austin NYRB Book Club.",
-            ),
-            "Voyage Out": (
-                "5:00 PM",
-                None,
-                "A regional reading series. Meets the 3rd Sunday of every month at 5pm.",
-            ),
-            "Apricot Trees Exist": (
-                "3:00 PM",
-                None,
-                "Reading poems for generative inspiration. Meets the 4th Sunday of every month at 3pm.",
-            ),
-        }
+        return _SERIES_INFO.get(series_name, _DEFAULT_SERIES_DETAILS)
 
-        return series_info.get(series_name, ("7:00 PM", None, "Book club meeting"))
+    def scrape_events(self, use_cache: bool = True) -> List[Dict]:
+        """Scrape book club events from Alienated Majesty Books website.
 
-    def scrape_events(self) -> List[Dict]:
-        """Scrape book club events from Alienated Majesty Books website"""
+        ``use_cache=False`` re-renders the page even if today's render is
+        cached (the fresh render replaces it when it yields events).
+        """
         print("Loading Alienated Majesty Books club...")
         events = []
 
         for url in self.get_target_urls():
             try:
                 # Use pyppeteer for JavaScript rendering
-                events = self._scrape_with_pyppeteer(url)
+                events = self._scrape_with_pyppeteer(url, use_cache=use_cache)
                 if events:
                     break
             except Exception as e:
@@ -15,7 +15,6 @@ Each event on artaustin.org has:
   - External URL (link to the venue's own page)
 """
 
-import json
 import re
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -2,13 +2,18 @@
 Arts on Alexander scraper using JSON data loading
 """
 
-import json
-import os
 from typing import Dict, List
 
 from src.base_scraper import BaseScraper
 
 
+def _as_list(value) -> list:
+    """Wrap a scalar ``dates``/``times`` value in a list; falsy becomes []."""
+    if isinstance(value, list):
+        return value
+    return [value] if value else []
+
+
 class ArtsOnAlexanderScraper(BaseScraper):
     """Simple scraper for Arts on Alexander events - loads from JSON data"""
 
@@ -26,35 +31,23 @@ class ArtsOnAlexanderScraper(BaseScraper):
         return []
 
     def scrape_events(self, use_cache: bool = True) -> List[Dict]:
-        """Load events from JSON file instead of web scraping"""
-        try:
-            if not os.path.exists(self.data_file):
-                print(f"Classical data file not found: {self.data_file}")
-                return []
-
-            with open(self.data_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            arts_events = data.get("artsOnAlexander", [])
-            standardized_events = []
+        """Load events from JSON file instead of web scraping.
 
-            for event in arts_events:
-                # Keep dates and times as arrays for consistency
-                dates = event.get("dates", [])
-                times = event.get("times", [])
-
-                # Ensure dates and times are always arrays
-                if not isinstance(dates, list):
-                    dates = [dates] if dates else []
-                if not isinstance(times, list):
-                    times = [times] if times else []
+        The parsed file comes from :meth:`BaseScraper._load_json`, which
+        re-reads it only when it changes on disk (or ``use_cache`` is False).
+        Events are rebuilt each call with fresh lists, so callers may mutate
+        them freely.
+        """
+        try:
+            data = self._load_json(self.data_file, use_cache=use_cache)
 
-                # Create standardized event
-                standardized_event = {
+            standardized_events = [
+                {
                     "title": event.get("title", ""),
                     "description": event.get("program", ""),
-                    "dates": dates,
-                    "times": times,
+                    # Keep dates and times as arrays for consistency
+                    "dates": list(_as_list(event.get("dates"))),
+                    "times": list(_as_list(event.get("times"))),
                     "venue": event.get("venue_name", "Arts on Alexander"),
                     "url": self.base_url,
                     "type": event.get("type", "concert"),
@@ -62,17 +55,20 @@ class ArtsOnAlexanderScraper(BaseScraper):
                     "program": event.get("program", ""),
                     "series": event.get("series", ""),
                     "featured_artist": event.get("featured_artist", ""),
-                    "composers": event.get("composers", []),
-                    "works": event.get("works", []),
+                    "composers": list(event.get("composers") or []),
+                    "works": list(event.get("works") or []),
                 }
-
-                standardized_events.append(standardized_event)
+                for event in data.get("artsOnAlexander", [])
+            ]
 
             print(
                 f"Loaded {len(standardized_events)} Arts on Alexander events from JSON"
             )
             return standardized_events
 
+        except FileNotFoundError:
+            print(f"Classical data file not found: {self.data_file}")
+            return []
         except Exception as e:
             print(f"Error loading Arts on Alexander data: {e}")
             return []
@@ -4,11 +4,96 @@ First Light Austin events and book club scraper using HTML parsing
 
 import re
 from datetime import datetime
-from typing import Dict, List
-
-from bs4 import BeautifulSoup
-
-from src.base_scraper import BaseScraper
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from src.base_scraper import HTML_PARSER, BaseScraper
+
+
+def _has_any_class(*names):
+    """SoupStrainer ``class_`` matcher for elements carrying any of ``names``.
+
+    Strainers see the raw ``class`` attribute string, so ``class_="x"`` alone
+    would miss ``class="x y"``.
+    """
+    wanted = frozenset(names)
+    return lambda value: bool(value) and not wanted.isdisjoint(value.split())
+
+
+# Only the subtrees the extractors read are built into the soup. Event pages
+# need the story/subtitle block, the "h2 article" title, the
+# "body-text article" description and the "tickets" RSVP button; the book
+# club page needs just the collection items.
+_EVENT_PAGE_ONLY = SoupStrainer(
+    ["div", "a"],
+    class_=_has_any_class("story-content", "subtitle", "article", "tickets"),
+)
+_BOOK_CLUB_ITEMS_ONLY = SoupStrainer("div", class_=_has_any_class("collection-item-8"))
+
+
+_DAY_SUFFIX_RE = re.compile(r"(\d+)(st|nd|rd|th)")
+
+# Event pages: book titles set in caps ("THE 5 TYPES OF WEALTH ...") or
+# introduced as "his/her/their (debut) book, TITLE". The caps run is capped
+# at 200 characters: unbounded, every "THE" inside a long unterminated caps
+# paragraph rescans to its end, which is quadratic in the paragraph length.
+_BOOK_ALLCAPS_RE = re.compile(
+    r"THE\s+[A-Z0-9\s]{1,200}?(?:\s+will\s+teach|\.|,|\s+was\s+an\s+instant|\s+and)"
+)
+_BOOK_TRAILER_RE = re.compile(r"\s+(will\s+teach|and|was\s+an\s+instant).*$")
+_THEIR_BOOK_RE = re.compile(
+    r"(?:his|her|their)\s+(?:debut\s+)?book,?\s+([A-Z][A-Z\s:]+?)[\.,]"
+)
+
+# Book club page.
+_FULL_CLUB_NAME_RE = re.compile(r"The\s+([^.]+?Book\s+Club)")
+_SELECTION_RE = re.compile(
+    r"[A-Z][a-z]+\s+selection:\s*(.+?)(?:\s*\.?\s*Meeting|\s*\.?\s*Meets|$)",
+    re.DOTALL,
+)
+_BY_RE = re.compile(r"\s+by\s+")
+_MEETING_TAIL_RE = re.compile(r"\s*Meeting\s+the\b.*$")
+_MONTHLY_MEETING_RE = re.compile(
+    r"Meeting\s+the\s+(?:first|second|third|fourth|fifth|last)\s+\w+\s+of\s+the\s+month,\s+"
+    r"([A-Za-z]+\s+\d{1,2})\s*,?\s*at\s+(\d+)(?::(\d{2}))?\s*([ap]\.?m)",
+    re.IGNORECASE,
+)
+_MEETS_RE = re.compile(
+    r"Meets\s+([^.]+?)\s+at\s+(\d+)(?::(\d{2}))?\s*([ap]\.?m)", re.IGNORECASE
+)
+_HOSTED_BY_RE = re.compile(r"Hosted\s+by\s+([^.]+?)(?:\.|$)")
+_HOST_NAME_RE = re.compile(
+    r"(?:First Light [^\.]+?\s+)([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)"
+)
+_HOST_SENTENCE_RE = re.compile(r"(Hosted\s+by\s+[^.]+\.)")
+
+# Smart apostrophe and curly double quotes to ASCII, in one pass.
+_SMART_QUOTES = str.maketrans({"\u2019": "'", "\u201c": '"', "\u201d": '"'})
+
+
+@lru_cache(maxsize=256)
+def _parse_month_day(date_str: str, year: int, month: int) -> Optional[str]:
+    """YYYY-MM-DD for 'Friday, June 27th' / 'April 13', or None if unrecognized.
+
+    Pure in its arguments (the caller passes today's year and month), so a
+    meeting date repeated across items or scrapes is only parsed once.
+    """
+    cleaned_date = date_str.strip().rstrip(",").strip()
+    cleaned_date = _DAY_SUFFIX_RE.sub(r"\1", cleaned_date)
+    for fmt in ("%Y %A, %B %d", "%Y %B %d"):
+        try:
+            base = (
+                cleaned_date.rpartition(", ")[2] if fmt == "%Y %B %d" else cleaned_date
+            )
+            date_obj = datetime.strptime(f"{year} {base}", fmt)
+            if date_obj.month < month:
+                date_obj = date_obj.replace(year=year + 1)
+            return date_obj.strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
 
 
 class FirstLightAustinScraper(BaseScraper):
@@ -54,40 +139,27 @@ class FirstLightAustinScraper(BaseScraper):
             print(f"Error parsing date/time '{date_time_str}': {e}")
             return None, None
 
-    def parse_book_club_date(self, date_str):
+    def parse_book_club_date(self, date_str, today: Optional[datetime] = None):
         """Parse book club date like 'Friday, June 27th' or 'April 13' into YYYY-MM-DD.
 
         Year inference: today is the anchor. If the parsed month is < current
         month, the event is next year; otherwise it's this year. This is the
         same dynamic-guidance rule the AlienatedMajesty scraper config uses.
+        Callers parsing several dates can pass ``today`` once.
         """
+        today = today or datetime.now()
         try:
-            cleaned_date = date_str.strip().rstrip(",").strip()
-            cleaned_date = re.sub(r"(\d+)(st|nd|rd|th)", r"\1", cleaned_date)
-
-            today = datetime.now()
-            for fmt in ("%Y %A, %B %d", "%Y %B %d"):
-                try:
-                    base = (
-                        cleaned_date.split(", ")[-1]
-                        if fmt == "%Y %B %d"
-                        else cleaned_date
-                    )
-                    date_obj = datetime.strptime(f"{today.year} {base}", fmt)
-                    if date_obj.month < today.month:
-                        date_obj = date_obj.replace(year=today.year + 1)
-                    return date_obj.strftime("%Y-%m-%d")
-                except ValueError:
-                    continue
-            print(f"Error parsing book club date '{date_str}': unrecognized format")
-            return None
+            parsed = _parse_month_day(date_str, today.year, today.month)
         except Exception as e:
             print(f"Error parsing book club date '{date_str}': {e}")
             return None
+        if parsed is None:
+            print(f"Error parsing book club date '{date_str}': unrecognized format")
+        return parsed
 
     def extract_author_events(self, html_content, url):
         """Extract author events from individual event page HTML"""
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=_EVENT_PAGE_ONLY)
 
         # Find the story content section
         story_content = soup.find("div", class_="story-content")
@@ -135,23 +207,15 @@ class FirstLightAustinScraper(BaseScraper):
             # emphasized)
             if not book:
                 # Look for patterns like "THE 5 TYPES OF WEALTH" in all caps
-                book_match = re.search(
-                    r"THE\s+[A-Z0-9\s]+?(?:\s+will\s+teach|\.|,|\s+was\s+an\s+instant|\s+and)",
-                    description,
-                )
+                book_match = _BOOK_ALLCAPS_RE.search(description)
                 if book_match:
                     book = book_match.group(0).strip()
                     # Clean up the match to remove trailing words
-                    book = re.sub(
-                        r"\s+(will\s+teach|and|was\s+an\s+instant).*$", "", book
-                    )
+                    book = _BOOK_TRAILER_RE.sub("", book)
                 else:
                     # Try finding patterns in quotes or after "his book" or
                     # "her book"
-                    quote_match = re.search(
-                        r"(?:his|her|their)\s+(?:debut\s+)?book,?\s+([A-Z][A-Z\s:]+?)[\.,]",
-                        description,
-                    )
+                    quote_match = _THEIR_BOOK_RE.search(description)
                     if quote_match:
                         book = quote_match.group(1).strip()
 
@@ -161,12 +225,9 @@ class FirstLightAustinScraper(BaseScraper):
 
         # Determine venue from description or default
         venue = "First Light Books"  # Default venue
-        if description:
-            if (
-                "Central branch of the Austin Public Library" in description
-                or "Austin Public Library" in description
-            ):
-                venue = "Austin Public Library Central Branch"
+        # Also covers "Central branch of the Austin Public Library".
+        if description and "Austin Public Library" in description:
+            venue = "Austin Public Library Central Branch"
 
         # Only return event if we have the essential data
         if title and date_str and time_str:
@@ -188,8 +249,11 @@ class FirstLightAustinScraper(BaseScraper):
 
     def extract_book_club_events(self, html_content, url):
         """Extract book club events from the book club page HTML by parsing the actual content"""
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(
+            html_content, HTML_PARSER, parse_only=_BOOK_CLUB_ITEMS_ONLY
+        )
         events = []
+        today = datetime.now()
 
         # Find all book club sections - they are in collection-item-8 divs
         book_club_items = soup.find_all("div", class_="collection-item-8")
@@ -213,12 +277,9 @@ class FirstLightAustinScraper(BaseScraper):
                     continue
 
                 description_text = description_elem.get_text().strip()
-                str(description_elem)
 
                 # Extract full club name from the bold text in description
-                full_club_name_match = re.search(
-                    r"The\s+([^.]+?Book\s+Club)", description_text
-                )
+                full_club_name_match = _FULL_CLUB_NAME_RE.search(description_text)
                 # Remove "The" prefix for consistency with test expectations
                 if full_club_name_match:
                     full_club_name = full_club_name_match.group(
@@ -232,21 +293,15 @@ class FirstLightAustinScraper(BaseScraper):
                 # "Hosted by …", so we MUST anchor on "selection:" before splitting.
                 book_title = None
                 author = None
-                sel_match = re.search(
-                    r"[A-Z][a-z]+\s+selection:\s*(.+?)(?:\s*\.?\s*Meeting|\s*\.?\s*Meets|$)",
-                    description_text,
-                    flags=re.DOTALL,
-                )
+                sel_match = _SELECTION_RE.search(description_text)
                 if sel_match:
                     selection_text = sel_match.group(1).strip().rstrip(".")
-                    by_split = re.split(r"\s+by\s+", selection_text, maxsplit=1)
+                    by_split = _BY_RE.split(selection_text, maxsplit=1)
                     if len(by_split) == 2:
                         book_title = by_split[0].strip()
                         # Strip a trailing 'Meeting' fragment that crept in when there's no
                         # period between author name and the 'Meeting…' sentence.
-                        author = re.sub(
-                            r"\s*Meeting\s+the\b.*$", "", by_split[1]
-                        ).strip()
+                        author = _MEETING_TAIL_RE.sub("", by_split[1]).strip()
                     else:
                         book_title = selection_text
 
@@ -255,6 +310,8 @@ class FirstLightAustinScraper(BaseScraper):
                     book_link = description_elem.find("a")
                     if book_link:
                         book_title = book_link.get_text().strip()
+                if not book_title:
+                    continue
 
                 # Extract meeting date and time. The site uses two phrasings:
                 #   old:  "Meets <date> at <H>(:<MM>)?<ampm>"
@@ -263,43 +320,31 @@ class FirstLightAustinScraper(BaseScraper):
                 date_str = None
                 time_str = None
 
-                meeting_match = re.search(
-                    r"Meeting\s+the\s+(?:first|second|third|fourth|fifth|last)\s+\w+\s+of\s+the\s+month,\s+"
-                    r"([A-Za-z]+\s+\d{1,2})\s*,?\s*at\s+(\d+)(?::(\d{2}))?\s*([ap]\.?m)",
-                    description_text,
-                    flags=re.IGNORECASE,
-                )
+                meeting_match = _MONTHLY_MEETING_RE.search(description_text)
                 if not meeting_match:
-                    meeting_match = re.search(
-                        r"Meets\s+([^.]+?)\s+at\s+(\d+)(?::(\d{2}))?\s*([ap]\.?m)",
-                        description_text,
-                        flags=re.IGNORECASE,
-                    )
+                    meeting_match = _MEETS_RE.search(description_text)
 
                 if meeting_match:
                     date_part = meeting_match.group(1).strip()
                     hour = meeting_match.group(2)
                     minutes = meeting_match.group(3) or "00"
                     ampm = meeting_match.group(4).replace(".", "").upper()
-                    date_str = self.parse_book_club_date(date_part)
+                    date_str = self.parse_book_club_date(date_part, today)
                     time_str = f"{hour}:{minutes} {ampm}"
+                if not (date_str and time_str):
+                    continue
 
                 # Extract host information
                 # Look for patterns like "Hosted by [Title] [Name]" and extract
                 # just the name
-                host_match = re.search(
-                    r"Hosted\s+by\s+([^.]+?)(?:\.|$)", description_text
-                )
+                host_match = _HOSTED_BY_RE.search(description_text)
                 host = None
                 if host_match:
                     host_text = host_match.group(1).strip()
                     # Extract just the person's name (typically the last 1-2 words)
                     # Look for patterns like "First Light [title] Name" or
                     # "Name"
-                    name_match = re.search(
-                        r"(?:First Light [^\.]+?\s+)([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                        host_text,
-                    )
+                    name_match = _HOST_NAME_RE.search(host_text)
                     if name_match:
                         host = name_match.group(1)
                     else:
@@ -316,7 +361,7 @@ class FirstLightAustinScraper(BaseScraper):
 
                 # Find where host information ends and truncate there (before
                 # selection details)
-                host_end_match = re.search(r"(Hosted\s+by\s+[^.]+\.)", main_description)
+                host_end_match = _HOST_SENTENCE_RE.search(main_description)
                 if host_end_match:
                     # Keep everything up to and including the host sentence
                     end_pos = host_end_match.end()
@@ -324,33 +369,23 @@ class FirstLightAustinScraper(BaseScraper):
 
                 # Normalize smart quotes and apostrophes to regular ASCII characters
                 # (but keep dashes as they are expected to remain Unicode)
-                main_description = main_description.replace(
-                    "\u2019", "'"
-                )  # Smart apostrophe to regular
-                main_description = main_description.replace(
-                    "\u201c", '"'
-                )  # Smart quote left to regular
-                main_description = main_description.replace(
-                    "\u201d", '"'
-                )  # Smart quote right to regular
-
-                # Only create event if we have essential data
-                if full_club_name and book_title and date_str and time_str:
-                    event = {
-                        "title": f"{full_club_name} - {book_title}",
-                        "type": "book_club",
-                        "author": author,
-                        "book": book_title,
-                        "dates": [date_str],
-                        "times": [time_str],
-                        "venue": "First Light Books",
-                        "host": host,
-                        "series": full_club_name,
-                        "description": main_description,
-                        "rsvp_url": None,
-                        "url": url,
-                    }
-                    events.append(event)
+                main_description = main_description.translate(_SMART_QUOTES)
+
+                event = {
+                    "title": f"{full_club_name} - {book_title}",
+                    "type": "book_club",
+                    "author": author,
+                    "book": book_title,
+                    "dates": [date_str],
+                    "times": [time_str],
+                    "venue": "First Light Books",
+                    "host": host,
+                    "series": full_club_name,
+                    "description": main_description,
+                    "rsvp_url": None,
+                    "url": url,
+                }
+                events.append(event)
 
             except Exception as e:
                 print(f"Error parsing book club item: {e}")
@@ -9,12 +9,13 @@ This scraper:
 5. Uses configuration-driven field extraction from movie template
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from bs4 import BeautifulSoup
 import re
 
-from src.base_scraper import BaseScraper
+from src.base_scraper import HTML_PARSER, BaseScraper
 from src.schemas import MovieEventSchema
 
 
@@ -27,6 +28,10 @@ class HyperrealScraper(BaseScraper):
     field extraction.
     """
 
+    # Concurrent event-page fetches; small enough to stay polite to
+    # hyperrealfilm.club and within the session's connection pool.
+    MAX_FETCH_WORKERS = 4
+
     def __init__(self, config=None, venue_key="hyperreal"):
         super().__init__(
             base_url="https://hyperrealfilm.club",
@@ -440,7 +445,7 @@ class HyperrealScraper(BaseScraper):
             Dict with extracted event data or None if extraction fails
         """
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, HTML_PARSER)
 
             # Extract raw data using existing patterns
             raw_data = self._extract_raw_data_from_html(soup)
@@ -479,7 +484,7 @@ class HyperrealScraper(BaseScraper):
                     continue
 
                 # Extract event links from the calendar page
-                soup = BeautifulSoup(response.text, "html.parser")
+                soup = BeautifulSoup(response.text, HTML_PARSER)
                 event_links = set()
 
                 # Find all event links (pattern: /events/*)
@@ -500,74 +505,14 @@ class HyperrealScraper(BaseScraper):
 
                 print(f"  Found {len(movie_links)} movie events")
 
-                # Scrape each individual event page
-                for event_url in movie_links:
-                    try:
-                        event_response = self.session.get(event_url, timeout=10)
-                        if event_response.status_code == 200:
-                            # First try Beautiful Soup extraction
-                            event_data = self.extract_event_with_beautifulsoup(
-                                html=event_response.text, event_url=event_url
-                            )
-
-                            if event_data:
-                                all_events.append(event_data)
-                                print(
-                                    f"    ✓ Extracted with BeautifulSoup: {event_data.get('title')}"
-                                )
-                            else:
-                                # Fallback to LLM extraction if Beautiful Soup fails
-                                print(
-                                    f"    BeautifulSoup extraction failed, trying LLM for {event_url}"
-                                )
-                                extraction_result = self.llm_service.extract_data(
-                                    content=event_response.text,
-                                    schema=self.get_data_schema(),
-                                    url=event_url,
-                                    content_type="html",
-                                )
-
-                                if extraction_result.get("success"):
-                                    event_data = extraction_result.get("data", {})
-
-                                    # Ensure we have dates and times as arrays
-                                    if (
-                                        "date" in event_data
-                                        and "dates" not in event_data
-                                    ):
-                                        event_data["dates"] = [event_data.pop("date")]
-                                    if (
-                                        "time" in event_data
-                                        and "times" not in event_data
-                                    ):
-                                        event_data["times"] = [event_data.pop("time")]
-
-                                    # Build event using config if available
-                                    if self.config:
-                                        event_data = self._build_event_from_config(
-                                            event_data, event_url
-                                        )
-                                        # Apply defaults
-                                        event_data = self.config.apply_default_values(
-                                            event_data, self.venue_key
-                                        )
-                                    else:
-                                        # Ensure required fields for backwards compatibility
-                                        if event_data.get("title") and event_data.get(
-                                            "dates"
-                                        ):
-                                            event_data["venue"] = self.venue_name
-                                            event_data["type"] = "movie"
-                                            event_data["url"] = event_url
-
-                                    if event_data.get("title"):
-                                        all_events.append(event_data)
-                                        print(
-                                            f"    ✓ Extracted with LLM: {event_data.get('title')}"
-                                        )
-                    except Exception as e:
-                        print(f"    Error extracting from {event_url}: {e}")
-                        continue
+                # Scrape each individual event page. Pages are fetched
+                # concurrently; map() keeps the link order.
+                with ThreadPoolExecutor(max_workers=self.MAX_FETCH_WORKERS) as executor:
+                    for event_data in executor.map(
+                        self._scrape_event_page, movie_links
+                    ):
+                        if event_data:
+                            all_events.append(event_data)
 
             except Exception as e:
                 print(f"  Error scraping {url}: {e}")
@@ -576,6 +521,67 @@ class HyperrealScraper(BaseScraper):
         print(f"Successfully scraped {len(all_events)} Hyperreal events total")
         return all_events
 
+    def _scrape_event_page(self, event_url: str) -> Optional[Dict]:
+        """Fetch one event page and extract its event (None on failure)."""
+        try:
+            event_response = self.session.get(event_url, timeout=10)
+            if event_response.status_code == 200:
+                # First try Beautiful Soup extraction
+                event_data = self.extract_event_with_beautifulsoup(
+                    html=event_response.text, event_url=event_url
+                )
+
+                if event_data:
+                    print(
+                        f"    ✓ Extracted with BeautifulSoup: {event_data.get('title')}"
+                    )
+                    return event_data
+                else:
+                    # Fallback to LLM extraction if Beautiful Soup fails
+                    print(
+                        f"    BeautifulSoup extraction failed, trying LLM for {event_url}"
+                    )
+                    extraction_result = self.llm_service.extract_data(
+                        content=event_response.text,
+                        schema=self.get_data_schema(),
+                        url=event_url,
+                        content_type="html",
+                    )
+
+                    if extraction_result.get("success"):
+                        event_data = extraction_result.get("data", {})
+
+                        # Ensure we have dates and times as arrays
+                        if "date" in event_data and "dates" not in event_data:
+                            event_data["dates"] = [event_data.pop("date")]
+                        if "time" in event_data and "times" not in event_data:
+                            event_data["times"] = [event_data.pop("time")]
+
+                        # Build event using config if available
+                        if self.config:
+                            event_data = self._build_event_from_config(
+                                event_data, event_url
+                            )
+                            # Apply defaults
+                            event_data = self.config.apply_default_values(
+                                event_data, self.venue_key
+                            )
+                        else:
+                            # Ensure required fields for backwards compatibility
+                            if event_data.get("title") and event_data.get("dates"):
+                                event_data["venue"] = self.venue_name
+                                event_data["type"] = "movie"
+                                event_data["url"] = event_url
+
+                        if event_data.get("title"):
+                            print(
+                                f"    ✓ Extracted with LLM: {event_data.get('title')}"
+                            )
+                            return event_data
+        except Exception as e:
+            print(f"    Error extracting from {event_url}: {e}")
+        return None
+
     def get_event_details(self, url: str) -> Dict:
         """Get additional details for a specific event - returns empty dict since details are already complete"""
         return {}
@@ -107,6 +107,96 @@ class TestAFSScraper(unittest.TestCase):
         self.assertTrue(len(urls) > 0)
         self.assertIn("https://www.austinfilm.org/calendar/", urls)
 
+    def _fake_get(self, pages):
+        """session.get stand-in serving ``pages[url]`` (empty body otherwise)."""
+        import unittest.mock
+
+        def fake_get(url, *args, **kwargs):
+            response = unittest.mock.MagicMock()
+            response.status_code = 200
+            response.text = pages.get(url, "<html><body></body></html>")
+            return response
+
+        return fake_get
+
+    def test_homepage_fetched_once_last_when_listings_are_empty(self):
+        """Listing URLs come from get_target_urls(); when they are all empty
+        the homepage is fetched exactly once, last, even if it is also a
+        target."""
+        homepage = f"{self.scraper.base_url}/"
+        calendar = f"{self.scraper.base_url}/calendar/"
+        pages = {homepage: self._load_test_html("jane_austen_movie_page.html")}
+        with patch.object(
+            self.scraper, "get_target_urls", return_value=[calendar, homepage]
+        ), patch.object(
+            self.scraper.session, "get", side_effect=self._fake_get(pages)
+        ) as mock_get:
+            events = self.scraper.scrape_events()
+        self.assertGreater(len(events), 0)
+        fetched = [c.args[0] for c in mock_get.call_args_list]
+        self.assertEqual(fetched, [calendar, homepage])
+
+    def test_homepage_not_fetched_when_listing_yields_events(self):
+        homepage = f"{self.scraper.base_url}/"
+        listing_url = self.scraper.get_target_urls()[0]
+        movie_url = f"{self.scraper.base_url}/screening/amadeus/"
+        pages = {
+            listing_url: '<html><body><a href="/screening/amadeus/">A</a></body></html>',
+            movie_url: self._load_test_html("screening_amadeus_2026.html"),
+        }
+        with patch.object(
+            self.scraper.session, "get", side_effect=self._fake_get(pages)
+        ) as mock_get:
+            events = self.scraper.scrape_events()
+        self.assertGreater(len(events), 0)
+        fetched = [c.args[0] for c in mock_get.call_args_list]
+        self.assertNotIn(homepage, fetched)
+        self.assertEqual(fetched, [listing_url, movie_url])
+
+    def test_concurrent_movie_fetches_keep_listing_order(self):
+        """Movie pages fetched in parallel come back in listing order; one
+        failing page does not drop the others."""
+        import unittest.mock
+
+        pages = {
+            "amadeus": self._load_test_html("screening_amadeus_2026.html"),
+            "broken": None,
+            "a-serious-man": self._load_test_html("screening_a_serious_man_2026.html"),
+        }
+        listing = "".join(f'<a href="/screening/{slug}/">{slug}</a>' for slug in pages)
+
+        def fake_get(url, *args, **kwargs):
+            response = unittest.mock.MagicMock()
+            response.status_code = 200
+            if "/screening/" not in url:
+                response.text = f"<html><body>{listing}</body></html>"
+                return response
+            slug = url.rstrip("/").rsplit("/", 1)[-1]
+            if pages[slug] is None:
+                raise ConnectionError("boom")
+            response.text = pages[slug]
+            return response
+
+        with patch.object(self.scraper.session, "get", side_effect=fake_get):
+            events = self.scraper.scrape_events()
+
+        titles = list(dict.fromkeys(e["title"] for e in events))
+        self.assertEqual(titles, ["AMADEUS", "A SERIOUS MAN"])
+
+    def test_non_decimal_digit_year_is_dropped_not_fatal(self):
+        """A superscript year like "¹⁹⁸⁴" passes str.isdigit() but not int();
+        the movie must still be extracted, just without a release year."""
+        from bs4 import BeautifulSoup
+
+        html = self._load_test_html("screening_amadeus_2026.html").replace(
+            "USA, 1984,", "USA, \u00b9\u2079\u2078\u2074,"
+        )
+        events = self.scraper._extract_movie_page_events(
+            BeautifulSoup(html, "html.parser"), "u"
+        )
+        self.assertGreater(len(events), 0)
+        self.assertIsNone(events[0]["release_year"])
+
     def test_type_is_movie_on_extracted_events(self):
         """Every emitted AFS event must have type='movie' so the processor filter accepts it."""
         html_content = self._load_test_html("jane_austen_movie_page.html")
@@ -283,6 +283,125 @@ class TestAlienatedMajestyBooksScraper(unittest.TestCase):
         self.assertGreater(len(events), 0, "LLM should extract some events")
 
 
+def test_series_layout_parsed_without_llm(monkeypatch):
+    """The older per-series layout is parsed directly; the LLM is not called."""
+    scraper = AlienatedMajestyBooksScraper()
+
+    def fail_llm(*args, **kwargs):
+        raise AssertionError("LLM fallback should not run")
+
+    monkeypatch.setattr(scraper, "_extract_with_llm", fail_llm)
+    html_path = (
+        Path(__file__).parent
+        / "Alienated_majesty_test_data"
+        / "rendered_book_clubs.html"
+    )
+    events = scraper._extract_book_club_events(
+        html_path.read_text(encoding="utf-8"),
+        "https://www.alienatedmajestybooks.com/book-clubs",
+    )
+
+    assert len(events) == 11
+    assert events[0]["title"] == "NYRB Book Club - Nightmare Alley"
+    assert all(e["type"] == "book_club" for e in events)
+
+
+def test_series_layout_paper_cuts_is_not_a_book_club(monkeypatch):
+    """Paper Cuts in the per-series layout matches the UPCOMING path."""
+    scraper = AlienatedMajestyBooksScraper()
+    monkeypatch.setattr(scraper, "_extract_with_llm", lambda *a, **k: [])
+    html = (
+        "<html><body><main><section>"
+        '<h2 class="bm-txt-1">Paper Cuts @ AFS Cinema</h2>'
+        "<p>Friday, November 14 — LANCELOT DU LAC by Robert Bresson</p>"
+        "</section></main></body></html>"
+    )
+    [event] = scraper._extract_book_club_events(
+        html, "https://www.alienatedmajestybooks.com/book-clubs"
+    )
+
+    assert event["type"] == "other"
+    assert event["venue"] == "AFS Cinema Lobby"
+    assert event["series"] == "Paper Cuts @ AFS Cinema"
+    assert event["companion_of"]["title"] == "LANCELOT DU LAC"
+    assert event["companion_of"]["date"] == event["dates"][0]
+
+
+_BOOK_CLUBS_URL = "https://www.alienatedmajestybooks.com/book-clubs"
+
+
+def _render_counting(scraper, monkeypatch, tmp_path, html):
+    monkeypatch.setattr(scraper, "RENDER_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def fake_render(url):
+        calls.append(url)
+        return html
+
+    monkeypatch.setattr(scraper, "_render_with_playwright", fake_render)
+    return calls
+
+
+def test_render_cache_skips_browser_on_same_day_rerun(tmp_path, monkeypatch):
+    """A render that yielded events is reused by a same-day rerun."""
+    scraper = AlienatedMajestyBooksScraper()
+    calls = _render_counting(scraper, monkeypatch, tmp_path, "<main>rendered</main>")
+    monkeypatch.setattr(
+        scraper, "_extract_book_club_events", lambda html, url: [{"title": "A"}]
+    )
+
+    assert scraper._scrape_with_pyppeteer(_BOOK_CLUBS_URL) == [{"title": "A"}]
+    assert scraper._scrape_with_pyppeteer(_BOOK_CLUBS_URL) == [{"title": "A"}]
+    assert calls == [_BOOK_CLUBS_URL]
+
+
+def test_render_cache_bypass_rerenders(tmp_path, monkeypatch):
+    scraper = AlienatedMajestyBooksScraper()
+    calls = _render_counting(scraper, monkeypatch, tmp_path, "<main>rendered</main>")
+    monkeypatch.setattr(
+        scraper, "_extract_book_club_events", lambda html, url: [{"title": "A"}]
+    )
+
+    scraper._scrape_with_pyppeteer(_BOOK_CLUBS_URL)
+    scraper._scrape_with_pyppeteer(_BOOK_CLUBS_URL, use_cache=False)
+    assert calls == [_BOOK_CLUBS_URL, _BOOK_CLUBS_URL]
+
+
+def test_render_without_events_is_not_cached(tmp_path, monkeypatch):
+    """A partial render (no events parsed) must not be replayed later."""
+    scraper = AlienatedMajestyBooksScraper()
+    calls = _render_counting(scraper, monkeypatch, tmp_path, "<main>partial</main>")
+    monkeypatch.setattr(scraper, "_extract_book_club_events", lambda html, url: [])
+
+    assert scraper._scrape_with_pyppeteer(_BOOK_CLUBS_URL) == []
+    assert scraper._scrape_with_pyppeteer(_BOOK_CLUBS_URL) == []
+    assert calls == [_BOOK_CLUBS_URL, _BOOK_CLUBS_URL]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_render_cache_does_not_store_failed_render(tmp_path, monkeypatch):
+    scraper = AlienatedMajestyBooksScraper()
+    _render_counting(scraper, monkeypatch, tmp_path, "")
+
+    assert scraper._scrape_with_pyppeteer("https://example.com/") == []
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_render_cache_drops_earlier_days(tmp_path, monkeypatch):
+    scraper = AlienatedMajestyBooksScraper()
+    _render_counting(scraper, monkeypatch, tmp_path, "<main>rendered</main>")
+    monkeypatch.setattr(
+        scraper, "_extract_book_club_events", lambda html, url: [{"title": "A"}]
+    )
+    stale = tmp_path / "2000-01-01-deadbeef.html"
+    stale.write_text("old", encoding="utf-8")
+
+    scraper._scrape_with_pyppeteer(_BOOK_CLUBS_URL)
+    [kept] = list(tmp_path.iterdir())
+    assert kept != stale
+    assert kept.read_text(encoding="utf-8") == "<main>rendered</main>"
+
+
 if __name__ == "__main__":
     # Run tests with verbose output
     unittest.main(verbosity=2)
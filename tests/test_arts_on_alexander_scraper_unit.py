@@ -0,0 +1,74 @@
+"""Unit tests for ``src/scrapers/arts_on_alexander_scraper.py``.
+
+The scraper reads ``artsOnAlexander`` from ``docs/classical_data.json``;
+these tests point it at a temp file instead.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from src.scrapers.arts_on_alexander_scraper import ArtsOnAlexanderScraper
+
+
+@pytest.fixture(autouse=True)
+def _no_llm_keys(monkeypatch):
+    """BaseScraper tolerates missing API keys with a printed warning."""
+    monkeypatch.delenv("PERPLEXITY_API_KEY", raising=False)
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+
+def _make(tmp_path: Path, payload: Dict) -> ArtsOnAlexanderScraper:
+    data_file = tmp_path / "classical_data.json"
+    data_file.write_text(json.dumps(payload), encoding="utf-8")
+    scraper = ArtsOnAlexanderScraper()
+    scraper.data_file = str(data_file)
+    return scraper
+
+
+def test_scalar_dates_and_times_become_arrays(tmp_path):
+    scraper = _make(
+        tmp_path,
+        {"artsOnAlexander": [{"title": "A", "dates": "2026-01-01", "times": ""}]},
+    )
+    [event] = scraper.scrape_events()
+    assert event["dates"] == ["2026-01-01"]
+    assert event["times"] == []
+    assert event["type"] == "concert"
+
+
+def test_unchanged_file_is_not_reparsed(tmp_path, monkeypatch):
+    scraper = _make(tmp_path, {"artsOnAlexander": [{"title": "A"}]})
+    first = scraper.scrape_events()
+
+    def fail_load(*args, **kwargs):
+        raise AssertionError("file should not be re-parsed")
+
+    monkeypatch.setattr(json, "load", fail_load)
+    assert scraper.scrape_events() == first
+
+
+def test_modified_file_is_reloaded(tmp_path):
+    scraper = _make(tmp_path, {"artsOnAlexander": [{"title": "A"}]})
+    assert [e["title"] for e in scraper.scrape_events()] == ["A"]
+
+    Path(scraper.data_file).write_text(
+        json.dumps({"artsOnAlexander": [{"title": "B"}]}), encoding="utf-8"
+    )
+    stat = os.stat(scraper.data_file)
+    os.utime(scraper.data_file, (stat.st_atime, stat.st_mtime + 10))
+    assert [e["title"] for e in scraper.scrape_events()] == ["B"]
+
+
+def test_mutating_events_does_not_leak_into_cache(tmp_path):
+    scraper = _make(
+        tmp_path, {"artsOnAlexander": [{"title": "A", "composers": ["Bach"]}]}
+    )
+    scraper.scrape_events()[0]["composers"].append("Mozart")
+    assert scraper.scrape_events()[0]["composers"] == ["Bach"]
@@ -182,6 +182,36 @@ class TestFirstLightScraper:
         pytest.skip("End-to-end test not implemented yet")
 
 
+_TEST_DATA = Path(__file__).parent / "First_Light_test_data"
+
+
+def _fixture_html(name):
+    return (_TEST_DATA / name).read_text(encoding="utf-8")
+
+
+def test_event_page_fields_survive_partial_parse():
+    """Multi-class targets ("h2 article", "button _3 tickets w-button") must
+    not be dropped by the parse-only strainer."""
+    scraper = FirstLightAustinScraper()
+    [event] = scraper.extract_author_events(
+        _fixture_html("sahil_bloom_5_types_wealth.html"), "u"
+    )
+    assert event["title"] == "Sahil Bloom: The 5 Types of Wealth"
+    assert event["dates"] == ["2025-06-30"]
+    assert event["times"] == ["7:00 PM"]
+    assert event["venue"] == "Austin Public Library Central Branch"
+    assert event["rsvp_url"]
+
+
+def test_book_club_items_survive_partial_parse():
+    scraper = FirstLightAustinScraper()
+    events = scraper.extract_book_club_events(
+        _fixture_html("first_light_book_club.html"), "u"
+    )
+    assert len(events) == 4
+    assert {e["type"] for e in events} == {"book_club"}
+
+
 # No dynamic test generation needed
 
 
@@ -404,3 +404,34 @@ def test_get_target_urls_is_empty(tmp_path: Path):
         tmp_path, payload=payload, top_level_key="things", default_event_type="concert"
     )
     assert scraper.get_target_urls() == []
+
+
+@pytest.mark.unit
+def test_shared_data_file_parsed_once_and_not_mutated(tmp_path: Path, monkeypatch):
+    """Two venues reading one file share a parse; event lists are copies."""
+    payload = {
+        "opera": [{"title": "O", "dates": ["2026-01-01"], "composers": ["Verdi"]}],
+        "symphony": [{"title": "S", "dates": ["2026-01-02"]}],
+    }
+    opera = _make(
+        tmp_path,
+        payload=payload,
+        top_level_key="opera",
+        default_event_type="opera",
+        file_name="shared.json",
+    )
+    opera.scrape_events()[0]["composers"].append("Puccini")
+
+    def fail_load(*args, **kwargs):
+        raise AssertionError("shared file should not be re-parsed")
+
+    monkeypatch.setattr(json, "load", fail_load)
+    symphony = StaticJsonScraper(
+        base_url="https://example.test",
+        venue_name="Symphony",
+        data_file=opera.data_file,
+        top_level_key="symphony",
+        default_event_type="concert",
+    )
+    assert [e["title"] for e in symphony.scrape_events()] == ["S"]
+    assert opera.scrape_events()[0]["composers"] == ["Verdi"]